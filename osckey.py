@@ -6,48 +6,173 @@ Receives OSC messages and triggers keyboard shortcuts
 
 from pythonosc import dispatcher, osc_server
 from pynput.keyboard import Controller, Key
-from flask import Flask, render_template_string, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_from_directory
 import threading
+import queue
+import select
 import time
 import logging
 import json
+import copy
+import hashlib
 import os
 import socket
 import subprocess
+import sys
 import webbrowser
 import datetime
-from collections import deque
+from collections import deque, namedtuple
+from functools import lru_cache
+from itertools import islice
 try:
     import rumps
     RUMPS_AVAILABLE = True
 except ImportError:
     RUMPS_AVAILABLE = False
-
-# In-memory log storage (stores last 500 log entries)
-log_buffer = deque(maxlen=500)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import Quartz
+    QUARTZ_AVAILABLE = True
+except ImportError:
+    QUARTZ_AVAILABLE = False
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# In-memory log storage (stores last 5000 log entries)
+log_buffer = deque(maxlen=5000)
+# Total number of entries ever added; clients use it as a cursor into the buffer
+log_count = 0
+# Queues of connected /api/logs/stream clients; guarded by buffer_handler.lock
+log_subscribers = set()
+LOG_SUBSCRIBER_QUEUE_SIZE = 1000
+LOG_KEEPALIVE_INTERVAL = 15.0  # Seconds of silence before a stream sends a keepalive
+# Each open stream holds a web server thread, so leave some for the other routes
+WEB_SERVER_THREADS = 8
+MAX_LOG_STREAMS = WEB_SERVER_THREADS - 2
+# Log messages containing this are tagged for the "OSC messages only" filter
+OSC_LOG_MARKER = 'OSC RECEIVED'
+
+# Consecutive repeats of a log message are counted instead of stored; the count
+# is stored once a different message arrives, or at most this many seconds later
+LOG_DEDUP_WINDOW = 1.0
 
 class BufferHandler(logging.Handler):
     """Custom logging handler that stores logs in memory"""
+    def __init__(self):
+        super().__init__()
+        # Last stored (level, message) and its repeats not yet stored, like syslog's
+        # "last message repeated N times"
+        self.last_key = None
+        self.repeats = 0
+        self.first_repeat = 0.0
+        self.last_repeat = 0.0
+
     def emit(self, record):
-        log_entry = {
-            'timestamp': self.format(record),
-            'level': record.levelname,
-            'message': record.getMessage()
-        }
-        log_buffer.append(log_entry)
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+        level = record.levelname
+        message = record.getMessage()
+
+        # Count consecutive repeats of the last message instead of storing them
+        key = (level, message)
+        if key == self.last_key:
+            if self.repeats == 0:
+                self.first_repeat = record.created
+            self.repeats += 1
+            self.last_repeat = record.created
+            self.flush_repeats(record.created)
+            return
+
+        self.flush_repeats()
+        self.last_key = key
+        self.store((record.created, level, message))
+
+    def flush_repeats(self, now=None):
+        """
+        Store how often the last message repeated. With `now`, only once the
+        first uncounted repeat is LOG_DEDUP_WINDOW seconds old.
+        """
+        if not self.repeats:
+            return
+        if now is not None and now - self.first_repeat < LOG_DEDUP_WINDOW:
+            return
+        level, message = self.last_key
+        times = "time" if self.repeats == 1 else "times"
+        self.store((self.last_repeat, level, f"{message} (repeated {self.repeats} more {times})"))
+        self.repeats = 0
+
+    def store(self, entry):
+        """Add an entry to the buffer and push it to live stream clients"""
+        global log_count
+        log_count += 1
+        # Serialize once here; readers just join the stored JSON bytes
+        entry += (dump_json(format_log_entry(entry, log_count)),)
+        log_buffer.append(entry)
+
+        # Push to live stream clients; a client that can't keep up misses entries
+        for subscriber in log_subscribers:
+            try:
+                subscriber.put_nowait((log_count, entry))
+            except queue.Full:
+                pass
+
+
+def read_logs_since(since):
+    """
+    Return (entries, next_cursor) for the buffered entries added after cursor `since`,
+    as (cursor, entry) pairs. A cursor ahead of the buffer (e.g. from before an app
+    restart) reads everything.
+    """
+    with buffer_handler.lock:
+        buffer_handler.flush_repeats(time.time())
+        if since > log_count:
+            since = 0
+        # Walk back from the newest entry so only the requested tail is touched
+        new_count = min(log_count - since, len(log_buffer))
+        newest = list(islice(reversed(log_buffer), new_count))
+        newest.reverse()
+        return list(enumerate(newest, log_count - new_count + 1)), log_count
+
+
+def format_log_entry(entry, seq):
+    """Format a (created, level, message) buffer entry with its cursor `seq` for the web UI"""
+    created, level, message = entry[:3]
+    asctime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+    msecs = int((created - int(created)) * 1000)
+    # Short keys keep the payload small; the client joins them into the log line.
+    # 'o' tags OSC entries so the browser's filter doesn't search the text
+    return {'s': seq, 't': f"{asctime},{msecs:03d}", 'l': level, 'm': message,
+            'o': OSC_LOG_MARKER in message}
+
+
+def dump_json(obj):
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Setup logging: one formatter for the console, raw records for the buffer
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+stream_handler = logging.StreamHandler(sys.stderr)
+stream_handler.setFormatter(log_formatter)
+logger.addHandler(stream_handler)
 
 # Add buffer handler to store logs
 buffer_handler = BufferHandler()
-buffer_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger.addHandler(buffer_handler)
 
+# Records are fully handled here; don't pass them on to the root logger
+logger.propagate = False
+
 # Initialize keyboard controller
 keyboard = Controller()
 
@@ -56,6 +181,11 @@ keyboard = Controller()
 CONFIG_DIR = os.path.expanduser("~/Library/Application Support/OSCKey")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "osc_keyboard_config.json")
 
+# App icon, shown in the menu bar and served as the web UI favicon
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_PATH = os.path.join(SCRIPT_DIR, "OSCKeyIcon.png")
+ICON_EXISTS = os.path.exists(ICON_PATH)
+
 # Default configuration
 DEFAULT_CONFIG = {
     "osc_port": 5005,
@@ -90,10 +220,20 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Requested OSC socket receive buffer size (bytes)
+OSC_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Repeats of the same OSC message closer together than this are collapsed into one press
+OSC_COALESCE_WINDOW = 0.02
+# Keypresses that waited in the queue longer than this are dropped (seconds)
+OSC_STALE_AFTER = 0.5
+
 # Global variables
-config = DEFAULT_CONFIG.copy()
+config = copy.deepcopy(DEFAULT_CONFIG)
 osc_server_instance = None
 osc_thread = None
+osc_server_ready = threading.Event()  # Set once start_osc_server has bound (or failed)
+last_config_hash = None  # Hash of the config file as last loaded or written
 
 # Modifier key mapping
 MODIFIERS = {
@@ -138,48 +278,218 @@ APPLESCRIPT_KEY_CODES = {
     'up': 126,
 }
 
+# macOS virtual key codes for posting key events through Quartz. Only keys whose
+# code is the same on every keyboard layout; characters go through pynput, which
+# resolves them with the active layout (e.g. 'z' is a different key on QWERTZ)
+MAC_KEY_CODES = {
+    'space': 49, ' ': 49,
+    'enter': 36, 'return': 36,
+    'tab': 48,
+    'backspace': 51,
+    'delete': 117,
+    'esc': 53, 'escape': 53,
+    'up': 126, 'down': 125, 'left': 123, 'right': 124,
+    'home': 115, 'end': 119,
+    'pageup': 116, 'pagedown': 121,
+    'f1': 122, 'f2': 120, 'f3': 99, 'f4': 118,
+    'f5': 96, 'f6': 97, 'f7': 98, 'f8': 100,
+    'f9': 101, 'f10': 109, 'f11': 103, 'f12': 111,
+}
+
+# Modifier name -> Quartz event flag
+if QUARTZ_AVAILABLE:
+    QUARTZ_MODIFIER_FLAGS = {
+        'command': Quartz.kCGEventFlagMaskCommand,
+        'cmd': Quartz.kCGEventFlagMaskCommand,
+        'option': Quartz.kCGEventFlagMaskAlternate,
+        'opt': Quartz.kCGEventFlagMaskAlternate,
+        'alt': Quartz.kCGEventFlagMaskAlternate,
+        'control': Quartz.kCGEventFlagMaskControl,
+        'ctrl': Quartz.kCGEventFlagMaskControl,
+        'shift': Quartz.kCGEventFlagMaskShift,
+    }
+else:
+    QUARTZ_MODIFIER_FLAGS = {}
+
+# Key combination with modifiers and keys already resolved to pynput objects
+CompiledShortcut = namedtuple('CompiledShortcut', [
+    'modifier_keys',     # tuple of pynput Key modifiers
+    'main_key',          # pynput Key, character, or None
+    'key_path',          # "/key/[Cmd+S]" string for logging
+    'uses_applescript',  # press through AppleScript instead of pynput
+    'key_code',          # macOS virtual key code for Quartz, or None to use pynput
+    'flags',             # Quartz modifier flag mask
+    'modifiers',         # modifier names as configured
+    'key',               # key name as configured
+    'description',
+])
+
+# Custom shortcuts compiled from config["custom_shortcuts"], keyed by OSC address
+compiled_shortcuts = {}
+
+# Incoming keypresses are queued and handled by a single worker thread
+keypress_queue = queue.SimpleQueue()
+# Arrival time of the newest queued press of each shortcut
+keypress_pending = {}
+keypress_pending_lock = threading.Lock()
+
+# Modifier name -> AppleScript "using" clause
+APPLESCRIPT_MODIFIERS = {
+    'command': 'command down',
+    'cmd': 'command down',
+    'option': 'option down',
+    'opt': 'option down',
+    'alt': 'option down',
+    'control': 'control down',
+    'ctrl': 'control down',
+    'shift': 'shift down',
+}
+
+# Persistent `osascript -i` helper so key presses don't pay for a process spawn
+osa_helper = None
+osa_helper_lock = threading.Lock()
+osa_sentinel_counter = 0
+OSA_HELPER_TIMEOUT = 2.0  # Seconds to wait for a script before giving up on the helper
+# A dead helper is restarted on the next press, waiting longer after each failure
+OSA_HELPER_RETRY_MIN = 1.0
+OSA_HELPER_RETRY_MAX = 60.0
+osa_helper_retry_delay = OSA_HELPER_RETRY_MIN
+osa_helper_retry_at = 0.0
+
+
+def start_applescript_helper():
+    """Start the long-lived osascript process used for AppleScript key presses"""
+    global osa_helper
+    try:
+        # -s s prints results in source form, so the sentinel strings come back quoted
+        osa_helper = subprocess.Popen(
+            ['osascript', '-s', 's', '-i'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # never read; errors come back through the sentinel
+            bufsize=0
+        )
+        logger.info("AppleScript helper started")
+    except Exception as e:
+        osa_helper = None
+        schedule_applescript_helper_retry()
+        logger.warning(f"AppleScript helper unavailable, using osascript per press: {e}")
+
+
+def schedule_applescript_helper_retry():
+    """Back off before the next helper restart, doubling the delay each time"""
+    global osa_helper_retry_at, osa_helper_retry_delay
+    osa_helper_retry_at = time.monotonic() + osa_helper_retry_delay
+    osa_helper_retry_delay = min(osa_helper_retry_delay * 2, OSA_HELPER_RETRY_MAX)
+
+
+def run_with_applescript_helper(applescript):
+    """
+    Run a single AppleScript line through the persistent helper.
+    Returns True if it ran, False if the script raised an error (which is logged),
+    or None if the helper is not running or stopped responding, so the caller
+    can fall back.
+    """
+    global osa_helper, osa_sentinel_counter, osa_helper_retry_delay
+    with osa_helper_lock:
+        if osa_helper is None or osa_helper.poll() is not None:
+            # Restart the helper once its backoff has passed
+            if time.monotonic() < osa_helper_retry_at:
+                return None
+            start_applescript_helper()
+            if osa_helper is None:
+                return None
+
+        osa_sentinel_counter += 1
+        ok_sentinel = f"OK:{osa_sentinel_counter}"
+        err_sentinel = f"ERR:{osa_sentinel_counter}:"
+
+        # osascript -i compiles one line at a time, so the try block is passed to
+        # `run script` as a string; its result is the sentinel that gets echoed back
+        script = (f'try\n{applescript}\non error m\nreturn "{err_sentinel}" & m\n'
+                  f'end try\nreturn "{ok_sentinel}"')
+        script = script.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        try:
+            osa_helper.stdin.write(f'run script "{script}"\n'.encode('utf-8'))
+
+            # Read until the sentinel echoes back, giving up after OSA_HELPER_TIMEOUT
+            fd = osa_helper.stdout.fileno()
+            deadline = time.monotonic() + OSA_HELPER_TIMEOUT
+            output = b''
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    raise TimeoutError("AppleScript helper did not respond")
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    raise EOFError("AppleScript helper exited")
+                *lines, output = (output + chunk).split(b'\n')  # Keep a partial line for later
+                for line in lines:
+                    line = line.decode('utf-8', 'replace')
+                    if f'"{ok_sentinel}"' in line:
+                        osa_helper_retry_delay = OSA_HELPER_RETRY_MIN
+                        return True
+                    if err_sentinel in line:
+                        error = line.split(err_sentinel, 1)[1].rstrip().rstrip('"')
+                        logger.error(f"AppleScript error: {error}")
+                        osa_helper_retry_delay = OSA_HELPER_RETRY_MIN
+                        return False
+        except Exception as e:
+            logger.warning(f"AppleScript helper failed, falling back: {e}")
+            osa_helper.kill()
+            osa_helper = None
+            schedule_applescript_helper_retry()
+            return None
+
+
+@lru_cache(maxsize=256)
+def build_applescript(modifiers, key):
+    """
+    Build the System Events AppleScript line for a key combination
+
+    Args:
+        modifiers: Tuple of lowercase modifier names (e.g., ('command', 'shift'))
+        key: The main key to press
+    """
+    modifier_parts = [APPLESCRIPT_MODIFIERS[mod] for mod in modifiers if mod in APPLESCRIPT_MODIFIERS]
+    modifier_str = ', '.join(modifier_parts)
+
+    # Use the key code if it's an arrow key, keystroke for regular keys
+    key_code = APPLESCRIPT_KEY_CODES.get(key.lower())
+    if key_code is not None:
+        action = f'key code {key_code}'
+    else:
+        action = f'keystroke "{key}"'
+
+    if modifier_str:
+        return f'tell application "System Events" to {action} using {{{modifier_str}}}'
+    return f'tell application "System Events" to {action}'
+
 
 def press_key_with_applescript(modifiers, key):
     """
     Press key using AppleScript for better compatibility with apps like Magnet
     """
     try:
-        # Build modifier string
-        modifier_parts = []
-        for mod in modifiers:
-            mod_lower = mod.lower()
-            if mod_lower in ['command', 'cmd']:
-                modifier_parts.append('command down')
-            elif mod_lower in ['option', 'opt', 'alt']:
-                modifier_parts.append('option down')
-            elif mod_lower in ['control', 'ctrl']:
-                modifier_parts.append('control down')
-            elif mod_lower in ['shift']:
-                modifier_parts.append('shift down')
-
-        modifier_str = ', '.join(modifier_parts) if modifier_parts else ''
-
-        # Get key code if it's an arrow key
-        key_lower = key.lower()
-        if key_lower in APPLESCRIPT_KEY_CODES:
-            key_code = APPLESCRIPT_KEY_CODES[key_lower]
-            if modifier_str:
-                applescript = f'tell application "System Events" to key code {key_code} using {{{modifier_str}}}'
-            else:
-                applescript = f'tell application "System Events" to key code {key_code}'
-        else:
-            # For regular keys, use keystroke
-            if modifier_str:
-                applescript = f'tell application "System Events" to keystroke "{key}" using {{{modifier_str}}}'
-            else:
-                applescript = f'tell application "System Events" to keystroke "{key}"'
-
-        # Execute AppleScript
-        result = subprocess.run(['osascript', '-e', applescript],
-                              capture_output=True, text=True, timeout=2)
-
-        if result.returncode != 0:
-            logger.error(f"AppleScript error: {result.stderr}")
+        applescript = build_applescript(tuple(mod.lower() for mod in modifiers), key)
+
+        # Execute AppleScript through the persistent helper when it is alive
+        result = run_with_applescript_helper(applescript)
+        if result is not None:
+            return result
+
+        # Fall back to a one-off osascript process, only capturing stderr
+        process = subprocess.Popen(['osascript', '-e', applescript],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        try:
+            _, stderr = process.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+
+        if process.returncode != 0:
+            logger.error(f"AppleScript error: {stderr.decode('latin-1')}")
             return False
 
         return True
@@ -191,29 +501,53 @@ def press_key_with_applescript(modifiers, key):
 
 def load_config():
     """Load configuration from file"""
-    global config
+    global config, last_config_hash
     try:
         # Create config directory if it doesn't exist
         os.makedirs(CONFIG_DIR, exist_ok=True)
 
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                loaded_config = json.load(f)
-                config.update(loaded_config)
-                logger.info("Configuration loaded from file")
+            with open(CONFIG_FILE, 'rb') as f:
+                data = f.read()
+            loaded_config = json.loads(data)
+            config.update(loaded_config)
+            # An unchanged save right after startup then skips the write
+            last_config_hash = hashlib.blake2b(data).digest()
+            logger.info("Configuration loaded from file")
         else:
             save_config()
             logger.info("Created default configuration file")
     except Exception as e:
         logger.error(f"Error loading config: {e}")
-        config = DEFAULT_CONFIG.copy()
+        config = copy.deepcopy(DEFAULT_CONFIG)
+
+    compile_shortcuts()
 
 
 def save_config():
     """Save configuration to file"""
+    global last_config_hash
+
+    # Keep the compiled shortcuts in sync with every config change
+    compile_shortcuts()
+
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = json.dumps(config, indent=2).encode('utf-8')
+
+        # Skip the write if nothing changed since the last save
+        config_hash = hashlib.blake2b(data).digest()
+        if config_hash == last_config_hash:
+            return
+
+        # Write to a temp file and swap it in so the config is never left half-written
+        tmp_file = CONFIG_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+
+        last_config_hash = config_hash
         logger.info("Configuration saved")
     except Exception as e:
         logger.error(f"Error saving config: {e}")
@@ -262,25 +596,34 @@ def detect_conflicts(import_shortcuts):
 def merge_shortcuts(selected_addresses, import_data):
     """Merge selected shortcuts into config"""
     imported_count = 0
+    shortcuts = dict(config['custom_shortcuts'])
     for address in selected_addresses:
         if address in import_data:
-            config['custom_shortcuts'][address] = import_data[address]
+            shortcuts[address] = import_data[address]
             imported_count += 1
+    config['custom_shortcuts'] = shortcuts
     save_config()
     return imported_count
 
 
-def press_key_combo(modifiers=None, key=None):
+@lru_cache(maxsize=1024)
+def format_combo(modifiers, key):
+    """Build the readable "Command+Shift+Z" string for a tuple of modifiers and a key"""
+    return '+'.join([m.capitalize() for m in modifiers] + ([key.upper()] if key else []))
+
+
+def compile_key_combo(modifiers, key, description=""):
     """
-    Press a keyboard shortcut with optional modifiers
-    
+    Resolve a key combination into the objects needed to press it
+
     Args:
         modifiers: List of modifier keys (e.g., ['command', 'shift'])
         key: The main key to press (e.g., 's', 'enter')
+        description: Optional shortcut description used for logging
     """
     if modifiers is None:
         modifiers = []
-    
+
     # Convert modifier names to Key objects
     modifier_keys = []
     for mod in modifiers:
@@ -289,110 +632,239 @@ def press_key_combo(modifiers=None, key=None):
             modifier_keys.append(MODIFIERS[mod_lower])
         else:
             logger.warning(f"Unknown modifier: {mod}")
-    
+
     # Get the main key
     main_key = None
+    key_lower = None
     if key:
         key_lower = key.lower()
-        if key_lower in SPECIAL_KEYS:
-            main_key = SPECIAL_KEYS[key_lower]
-        else:
-            # Regular character key
-            main_key = key
-    
-    # Press the key combination
-    try:
-        # Build readable key combo string
-        if key:
-            combo_str = '+'.join([m.capitalize() for m in modifiers] + [key.upper()])
-        else:
-            combo_str = '+'.join([m.capitalize() for m in modifiers])
+        # Special key, or a regular character key
+        main_key = SPECIAL_KEYS.get(key_lower, key)
+
+    # Resolve the virtual key code and modifier flags for posting through Quartz
+    key_code = None
+    flags = 0
+    if QUARTZ_AVAILABLE and key_lower in MAC_KEY_CODES:
+        key_code = MAC_KEY_CODES[key_lower]
+        for mod in modifiers:
+            flags |= QUARTZ_MODIFIER_FLAGS.get(mod.lower(), 0)
 
-        logger.info(f"PRESSING: /key/[{combo_str}]")
+    # Build readable key combo string
+    combo_str = format_combo(tuple(modifiers), key)
 
+    return CompiledShortcut(
+        modifier_keys=tuple(modifier_keys),
+        main_key=main_key,
+        key_path=f"/key/[{combo_str}]",
         # Use AppleScript for arrow keys with modifiers (for Magnet compatibility)
-        key_lower = key.lower() if key else None
-        if key_lower in APPLESCRIPT_KEY_CODES and modifiers:
-            logger.info(f"Using AppleScript method for better app compatibility")
-            success = press_key_with_applescript(modifiers, key)
+        uses_applescript=bool(key_lower in APPLESCRIPT_KEY_CODES and modifiers),
+        key_code=key_code,
+        flags=flags,
+        modifiers=tuple(modifiers),
+        key=key,
+        description=description or ""
+    )
+
+
+def compile_shortcut(shortcut):
+    """Compile a custom shortcut from the config"""
+    return compile_key_combo(
+        shortcut.get("modifiers", []),
+        shortcut.get("key"),
+        shortcut.get("description", "")
+    )
+
+
+def compile_shortcuts():
+    """Rebuild the compiled shortcut table from the current config"""
+    global compiled_shortcuts
+    # Build a new table and swap it in, so the OSC thread never sees a half-built one
+    compiled = {}
+    for address, shortcut in config.get("custom_shortcuts", {}).items():
+        try:
+            compiled[address] = compile_shortcut(shortcut)
+        except Exception as e:
+            logger.error(f"Error compiling shortcut {address}: {e}")
+    compiled_shortcuts = compiled
+
+
+def post_key_event(key_code, flags):
+    """Post a key down/up pair carrying the modifier flags through Quartz"""
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, key_code, key_down)
+        Quartz.CGEventSetFlags(event, flags)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+
+def press_compiled_shortcut(shortcut):
+    """Press a shortcut that was resolved by compile_key_combo"""
+    # Per-step messages repeat the OSC RECEIVED line, so only log them when debugging
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    try:
+        if verbose:
+            logger.debug(f"PRESSING: {shortcut.key_path}")
+
+        if shortcut.uses_applescript:
+            if verbose:
+                logger.debug("Using AppleScript method for better app compatibility")
+            success = press_key_with_applescript(shortcut.modifiers, shortcut.key)
             if success:
-                logger.info(f"SUCCESS: /key/[{combo_str}]")
+                if verbose:
+                    logger.debug(f"SUCCESS: {shortcut.key_path}")
             else:
-                logger.error(f"AppleScript method failed for /key/[{combo_str}]")
+                logger.error(f"AppleScript method failed for {shortcut.key_path}")
+            return
+
+        # Post the key with its modifier flags in one Quartz event, no settle delay needed
+        if shortcut.key_code is not None:
+            post_key_event(shortcut.key_code, shortcut.flags)
+            if verbose:
+                logger.debug(f"SUCCESS: {shortcut.key_path}")
             return
 
         # Use pynput for everything else
+        press = keyboard.press
+        release = keyboard.release
+        modifier_keys = shortcut.modifier_keys
+
         # Press all modifiers
         for mod_key in modifier_keys:
-            keyboard.press(mod_key)
+            press(mod_key)
 
-        time.sleep(0.01)
+        # Give the modifier state time to settle (not needed without modifiers)
+        if modifier_keys:
+            time.sleep(0.01)
 
         # Press and release the main key
-        if main_key:
-            keyboard.press(main_key)
-            keyboard.release(main_key)
+        if shortcut.main_key:
+            press(shortcut.main_key)
+            release(shortcut.main_key)
 
-        time.sleep(0.01)
+        if modifier_keys:
+            time.sleep(0.01)
 
         # Release all modifiers in reverse order
         for mod_key in reversed(modifier_keys):
-            keyboard.release(mod_key)
+            release(mod_key)
 
-        logger.info(f"SUCCESS: /key/[{combo_str}]")
+        if verbose:
+            logger.debug(f"SUCCESS: {shortcut.key_path}")
 
     except Exception as e:
         logger.error(f"ERROR pressing key combo: {e}")
 
 
+def press_key_combo(modifiers=None, key=None):
+    """
+    Press a keyboard shortcut with optional modifiers
+
+    Kept as the entry point for hand-written shortcuts (see "Edit the Python code"
+    in osc_keyboard_guide.md). The press is queued for the keypress worker like
+    any OSC shortcut, so it never interleaves with another one.
+
+    Args:
+        modifiers: List of modifier keys (e.g., ['command', 'shift'])
+        key: The main key to press (e.g., 's', 'enter')
+    """
+    shortcut = compile_key_combo(modifiers, key)
+    enqueue_keypress(shortcut.key_path, shortcut)
+
+
 def handle_keypress(address, *args):
-    """Handle incoming OSC messages for keypresses"""
-    # Build the key combo string for logging
-    def build_key_path(mods, k):
-        """Build /key/[KeyCombo] format"""
-        if k:
-            combo = '+'.join([m.capitalize() for m in mods] + [k.upper()])
-        else:
-            combo = '+'.join([m.capitalize() for m in mods])
-        return f"/key/[{combo}]"
-
-    # Check custom shortcuts first
-    if address in config["custom_shortcuts"]:
-        shortcut = config["custom_shortcuts"][address]
-        shortcut_desc = shortcut.get("description", "")
-        mods = shortcut.get("modifiers", [])
-        k = shortcut.get("key")
-        key_path = build_key_path(mods, k)
-
-        if shortcut_desc:
-            logger.info(f"OSC RECEIVED: {address} -> {key_path} ({shortcut_desc})")
-        else:
-            logger.info(f"OSC RECEIVED: {address} -> {key_path}")
-        press_key_combo(mods, k)
-        return
-
-    # If no args provided, try to extract key from address (e.g., /key/down -> "down")
-    if not args and address.startswith('/key/'):
-        key_from_address = address[5:].strip()  # Remove '/key/' prefix and clean whitespace
-        if key_from_address:
-            args = [key_from_address]
+    """
+    Handle incoming OSC messages for keypresses
+
+    The message is resolved to a shortcut here and queued; the keypress worker
+    presses it, so the OSC thread goes straight back to reading the socket.
+    """
+    shortcut = resolve_keypress(address, args)
+    if shortcut is not None:
+        enqueue_keypress(address, shortcut)
+
+
+def enqueue_keypress(address, shortcut):
+    """Queue a compiled shortcut for the keypress worker"""
+    received_at = time.monotonic()
+    with keypress_pending_lock:
+        keypress_pending[shortcut] = received_at
+    keypress_queue.put((address, shortcut, received_at))
+
+
+def keypress_worker():
+    """
+    Press queued shortcuts one at a time, dropping stale and repeated ones.
+    Being the only thread that synthesizes keys keeps modifier press/release
+    sequences from interleaving.
+    """
+    while True:
+        address, shortcut, received_at = keypress_queue.get()
+        try:
+            # Coalesce: skip this press if the same shortcut arrived again right after it
+            with keypress_pending_lock:
+                newest = keypress_pending.get(shortcut)
+                if newest == received_at:
+                    del keypress_pending[shortcut]
+            if newest is not None and newest != received_at and newest - received_at < OSC_COALESCE_WINDOW:
+                logger.info(f"OSC DROPPED (coalesced): {address}")
+                continue
+
+            if time.monotonic() - received_at > OSC_STALE_AFTER:
+                logger.warning(f"OSC DROPPED (stale): {address}")
+                continue
+
+            press_compiled_shortcut(shortcut)
+        except Exception as e:
+            logger.error(f"Error processing keypress: {e}")
+
+
+def resolve_keypress(address, args):
+    """Resolve an OSC keypress message to a compiled shortcut and log it"""
+    # Check custom shortcuts first (already resolved at config load)
+    shortcut = compiled_shortcuts.get(address)
+    if shortcut is not None:
+        if shortcut.description:
+            logger.info(f"OSC RECEIVED: {address} -> {shortcut.key_path} ({shortcut.description})")
         else:
-            logger.warning(f"OSC RECEIVED: {address} -> No arguments provided")
-            return
-    elif not args:
+            logger.info(f"OSC RECEIVED: {address} -> {shortcut.key_path}")
+        return shortcut
+
+    if not args and not address[5:].strip():
         logger.warning(f"OSC RECEIVED: {address} -> No arguments provided")
-        return
+        return None
 
-    # If first arg is a string with spaces, split it
+    # If the only arg is a string with spaces, split it
     if len(args) == 1 and isinstance(args[0], str) and ' ' in args[0]:
         args = args[0].split()
 
+    # Cache on the strings the parser reads, so e.g. 1, 1.0 and True stay distinct
+    # and unhashable arguments (OSC arrays) can be cached too
+    shortcut = parse_key_address(address, tuple(str(arg).strip() for arg in args))
+
+    if shortcut is not None:
+        logger.info(f"OSC RECEIVED: {address} -> {shortcut.key_path}")
+    else:
+        logger.warning(f"OSC RECEIVED: {address} -> No valid key or modifier found")
+    return shortcut
+
+
+@lru_cache(maxsize=512)
+def parse_key_address(address, args):
+    """
+    Parse a /key message into a compiled shortcut, or None if it names no key or modifier
+
+    Args:
+        address: OSC address (e.g., '/key' or '/key/down')
+        args: Tuple of stripped argument strings (e.g., ('command', 's'))
+    """
+    # If no args provided, try to extract keys from address (e.g., /key/down -> "down")
+    if not args:
+        args = address[5:].split()  # Remove '/key/' prefix and split on whitespace
+
     # Separate modifiers from the main key
     modifiers = []
     key = None
 
-    for arg in args:
-        arg_str = str(arg).strip()  # Clean whitespace
+    for arg_str in args:
         arg_lower = arg_str.lower()
         if arg_lower in MODIFIERS:
             modifiers.append(arg_str)
@@ -400,13 +872,9 @@ def handle_keypress(address, *args):
             key = arg_str
             break
 
-    # Log and execute the keypress
     if key or modifiers:
-        key_path = build_key_path(modifiers, key)
-        logger.info(f"OSC RECEIVED: {address} -> {key_path}")
-        press_key_combo(modifiers, key)
-    else:
-        logger.warning(f"OSC RECEIVED: {address} -> No valid key or modifier found")
+        return compile_key_combo(modifiers, key)
+    return None
 
 
 def handle_unmatched_osc(address, *args):
@@ -419,15 +887,51 @@ def handle_unmatched_osc(address, *args):
     logger.warning(f"   Hint: Expected address format is /key or /key/... (e.g., /key/save)")
 
 
+class KeyDispatcher(dispatcher.Dispatcher):
+    """
+    OSC dispatcher that routes /key messages with plain string checks
+    instead of python-osc's per-message address pattern matching.
+    Other addresses go through the usual disp.map() registrations.
+    """
+    def __init__(self):
+        super().__init__()
+        self.keypress_handler = dispatcher.Handler(handle_keypress, [])
+
+    def handlers_for_address(self, address_pattern):
+        if (address_pattern in compiled_shortcuts
+                or address_pattern == "/key"
+                or address_pattern.startswith("/key/")):
+            yield self.keypress_handler
+        else:
+            # Falls back to the default handler when nothing is mapped
+            yield from super().handlers_for_address(address_pattern)
+
+
+class OSCKeyUDPServer(osc_server.BlockingOSCUDPServer):
+    """Single-threaded OSC UDP server with socket options applied before bind"""
+    def server_bind(self):
+        # Enable socket reuse to prevent "Address already in use" errors
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+        # Let several sockets share the port (kernel load-balances them on Linux)
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass  # Not supported on this platform
+
+        # Don't leak the socket into child processes such as osascript
+        os.set_inheritable(self.socket.fileno(), False)
+
+        super().server_bind()
+
+
 def start_osc_server():
     """Start the OSC server"""
     global osc_server_instance
 
     try:
         # Setup OSC dispatcher
-        disp = dispatcher.Dispatcher()
-        disp.map("/key", handle_keypress)
-        disp.map("/key/*", handle_keypress)
+        disp = KeyDispatcher()
         # Catch-all for unmatched messages
         disp.set_default_handler(handle_unmatched_osc)
 
@@ -435,16 +939,43 @@ def start_osc_server():
         osc_ip = config.get("osc_ip", "127.0.0.1")
         osc_port = config.get("osc_port", 5005)
 
-        osc_server_instance = osc_server.ThreadingOSCUDPServer((osc_ip, osc_port), disp)
+        # Single-threaded server: datagrams are read and dispatched in order on this
+        # thread instead of spawning a new thread for every incoming message
+        osc_server_instance = OSCKeyUDPServer((osc_ip, osc_port), disp)
 
-        # Enable socket reuse to prevent "Address already in use" errors
-        osc_server_instance.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Enlarge the receive buffer so bursts from a controller aren't dropped by the kernel.
+        # The OS may cap this (kern.ipc.maxsockbuf on macOS, net.core.rmem_max on Linux),
+        # so log the size we actually got.
+        try:
+            osc_server_instance.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, OSC_RECEIVE_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning(f"Could not enlarge OSC receive buffer: {e}")
+        rcvbuf = osc_server_instance.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        logger.info(f"OSC receive buffer: {rcvbuf // 1024} KB")
 
         logger.info(f"OSC Server started on {osc_ip}:{osc_port}")
+        osc_server_ready.set()
         osc_server_instance.serve_forever()
 
     except Exception as e:
         logger.error(f"Error starting OSC server: {e}")
+        osc_server_ready.set()
+
+
+def wait_for_port_release(ip, port, timeout=1.0):
+    """Poll until the UDP port can be bound again, giving up after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            bind_test = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                bind_test.bind((ip, port))
+                return True
+            finally:
+                bind_test.close()
+        except OSError:
+            time.sleep(0.02)
+    return False
 
 
 def restart_osc_server():
@@ -460,18 +991,19 @@ def restart_osc_server():
             if osc_thread:
                 osc_thread.join(timeout=3)
 
-        # Give the OS time to release the port
-        time.sleep(0.5)
+        # Wait (up to 1s) until the OS has released the port
+        wait_for_port_release(config.get("osc_ip", "127.0.0.1"), config.get("osc_port", 5005))
 
         # Clear the old instance
         osc_server_instance = None
 
         # Start new server
+        osc_server_ready.clear()
         osc_thread = threading.Thread(target=start_osc_server, daemon=True)
         osc_thread.start()
 
-        # Wait a moment to ensure server starts
-        time.sleep(0.5)
+        # Wait until the new server has bound its socket (or failed to)
+        osc_server_ready.wait(timeout=1.0)
 
         logger.info("OSC server restarted")
         return True
@@ -752,19 +1284,24 @@ HTML_TEMPLATE = """
             color: #f5f5f7;
             font-family: 'Monaco', 'Courier New', monospace;
             font-size: 12px;
-            padding: 16px;
             border-radius: 8px;
             height: 500px;
             overflow-y: auto;
-            line-height: 1.6;
-        }
-        .log-entry {
-            margin-bottom: 4px;
-            white-space: pre-wrap;
-            word-wrap: break-word;
+            /* Long lines scroll sideways instead of being cut off */
+            overflow-x: auto;
+            position: relative;
         }
-        .log-entry.INFO {
-            color: #f5f5f7;
+        .log-rows {
+            position: absolute;
+            left: 0;
+            right: 0;
+            min-width: max-content;
+            margin: 0;
+            padding: 0 16px;
+            font: inherit;
+            /* Fixed line height so the virtualized viewer can position rows */
+            line-height: 20px;
+            white-space: pre;
         }
         .log-entry.WARNING {
             color: #ffcc00;
@@ -1134,7 +1671,10 @@ HTML_TEMPLATE = """
                     </div>
                     <button class="btn btn-primary" onclick="clearLogs()">Clear Logs</button>
                 </div>
-                <div id="log-viewer" class="log-viewer"></div>
+                <div id="log-viewer" class="log-viewer">
+                    <div id="log-spacer"></div>
+                    <pre id="log-rows" class="log-rows"></pre>
+                </div>
             </div>
         </div>
         <!-- End Logs Tab -->
@@ -1312,77 +1852,202 @@ HTML_TEMPLATE = """
         }
         
         // Tab switching
+        // Tab buttons and contents, cached on load
+        let tabButtons = [];
+        let tabContents = [];
+        const tabContentsByName = new Map();
+
         function switchTab(tabName) {
             // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {
+            for (const tab of tabContents) {
                 tab.classList.remove('active');
-            });
-            document.querySelectorAll('.tab').forEach(tab => {
+            }
+            for (const tab of tabButtons) {
                 tab.classList.remove('active');
-            });
+            }
 
             // Show selected tab
-            document.getElementById(tabName + '-tab').classList.add('active');
+            tabContentsByName.get(tabName).classList.add('active');
             event.target.classList.add('active');
 
             // Start log polling if switching to logs tab
             if (tabName === 'logs') {
-                startLogPolling();
+                startLogStream();
             } else {
-                stopLogPolling();
+                stopLogStream();
             }
         }
 
-        // Log viewer
+        // Log viewer (virtualized: only the rows in view are in the DOM)
+        let logStream = null;
         let logPollInterval = null;
-        let lastLogCount = 0;
+        let lastLogCount = 0;  // Server cursor: number of log entries already fetched
+        let logEntries = [];   // Most recent log entries, oldest first
+        let visibleLogs = logEntries;  // logEntries, or only its OSC entries while filtering
+        let logRenderScheduled = false;
+        let pendingLogs = [];  // Streamed entries waiting for the next frame
+        let logFlushScheduled = false;
+        const LOG_FLUSH_COUNT = 64;    // Flush right away once this many are waiting
+        const MAX_LOG_ENTRIES = 2000;  // Oldest entries are dropped beyond this
+        const LOG_ROW_HEIGHT = 20;     // Must match the .log-rows line-height in CSS
+        const LOG_OVERSCAN = 10;       // Extra rows rendered above and below the viewport
 
         async function fetchLogs() {
             try {
-                const response = await fetch('/api/logs');
+                const response = await fetch('/api/logs?since=' + lastLogCount);
+                if (response.status === 204) return;  // Nothing new since the last fetch
                 const data = await response.json();
-                const logViewer = document.getElementById('log-viewer');
-                const autoscroll = document.getElementById('autoscroll').checked;
-                const filterOsc = document.getElementById('filter-osc').checked;
-
-                // Only update if logs changed
-                if (data.logs.length !== lastLogCount) {
-                    logViewer.innerHTML = '';
-                    data.logs.forEach(log => {
-                        // Filter for OSC messages if checkbox is enabled
-                        if (filterOsc && !log.message.includes('OSC RECEIVED')) {
-                            return;
-                        }
-
-                        const div = document.createElement('div');
-                        div.className = 'log-entry ' + log.level;
-                        div.textContent = log.timestamp;
-                        logViewer.appendChild(div);
-                    });
-
-                    lastLogCount = data.logs.length;
-
-                    // Auto-scroll to bottom if enabled
-                    if (autoscroll) {
-                        logViewer.scrollTop = logViewer.scrollHeight;
-                    }
+
+                // Only append the entries added since the last fetch
+                if (data.logs.length > 0) {
+                    appendLogs(data.logs);
                 }
+
+                lastLogCount = data.next;
             } catch (error) {
                 console.error('Error fetching logs:', error);
             }
         }
 
-        // Re-render logs when filter changes
+        function isOscLog(log) {
+            return log.o;  // Tagged by the server when the entry is stored
+        }
+
+        // Which of logEntries are shown; the filter is applied locally, so
+        // toggling it never refetches from the server
+        function updateVisibleLogs() {
+            const filterOsc = document.getElementById('filter-osc').checked;
+            visibleLogs = filterOsc ? logEntries.filter(isOscLog) : logEntries;
+        }
+
+        function appendLogs(logs) {
+            const filtering = visibleLogs !== logEntries;
+            for (const log of logs) {
+                logEntries.push(log);
+                if (filtering && isOscLog(log)) {
+                    visibleLogs.push(log);
+                }
+            }
+
+            // Keep only the most recent entries
+            if (logEntries.length > MAX_LOG_ENTRIES) {
+                const dropped = logEntries.splice(0, logEntries.length - MAX_LOG_ENTRIES);
+                if (filtering) {
+                    visibleLogs.splice(0, dropped.filter(isOscLog).length);
+                }
+            }
+
+            // Auto-scroll to bottom if enabled
+            if (document.getElementById('autoscroll').checked) {
+                const logViewer = document.getElementById('log-viewer');
+                document.getElementById('log-spacer').style.height = (visibleLogs.length * LOG_ROW_HEIGHT) + 'px';
+                logViewer.scrollTop = logViewer.scrollHeight;
+            }
+            renderLogWindow();
+        }
+
+        // Batch streamed entries so a burst touches the DOM once per frame
+        function queueLog(log) {
+            pendingLogs.push(log);
+            if (pendingLogs.length >= LOG_FLUSH_COUNT) {
+                flushPendingLogs();
+            } else if (!logFlushScheduled) {
+                logFlushScheduled = true;
+                requestAnimationFrame(flushPendingLogs);
+            }
+        }
+
+        function flushPendingLogs() {
+            logFlushScheduled = false;
+            if (pendingLogs.length === 0) return;
+            const logs = pendingLogs;
+            pendingLogs = [];
+            appendLogs(logs);
+        }
+
+        function scheduleLogRender() {
+            if (logRenderScheduled) return;
+            logRenderScheduled = true;
+            requestAnimationFrame(renderLogWindow);
+        }
+
+        // Render the slice of visibleLogs that is currently scrolled into view
+        function renderLogWindow() {
+            logRenderScheduled = false;
+            const logViewer = document.getElementById('log-viewer');
+            const rows = document.getElementById('log-rows');
+            document.getElementById('log-spacer').style.height = (visibleLogs.length * LOG_ROW_HEIGHT) + 'px';
+
+            const startIdx = Math.max(0, Math.floor(logViewer.scrollTop / LOG_ROW_HEIGHT) - LOG_OVERSCAN);
+            const endIdx = Math.min(visibleLogs.length,
+                Math.ceil((logViewer.scrollTop + logViewer.clientHeight) / LOG_ROW_HEIGHT) + LOG_OVERSCAN);
+
+            // Build the window as one HTML string and parse it in a single call
+            let html = '';
+            for (let i = startIdx; i < endIdx; i++) {
+                const log = visibleLogs[i];
+                html += '<span class="log-entry ' + log.l + '">' +
+                    escapeHtml(log.t + ' - ' + log.l + ' - ' + log.m) + '</span>\\n';
+            }
+            rows.style.top = (startIdx * LOG_ROW_HEIGHT) + 'px';
+            rows.innerHTML = html;
+        }
+
+        const escapeTextarea = document.createElement('textarea');
+        function escapeHtml(text) {
+            escapeTextarea.textContent = text;
+            return escapeTextarea.innerHTML;
+        }
+
         document.addEventListener('DOMContentLoaded', function() {
+            tabButtons = Array.from(document.querySelectorAll('.tab'));
+            tabContents = Array.from(document.querySelectorAll('.tab-content'));
+            for (const tab of tabContents) {
+                tabContentsByName.set(tab.id.replace(/-tab$/, ''), tab);
+            }
+
+            // Re-render the visible rows while scrolling
+            document.getElementById('log-viewer').addEventListener('scroll', scheduleLogRender);
+
+            // Show or hide the loaded entries when the filter changes
             const filterCheckbox = document.getElementById('filter-osc');
             if (filterCheckbox) {
                 filterCheckbox.addEventListener('change', function() {
-                    lastLogCount = 0; // Force re-render
-                    fetchLogs();
+                    updateVisibleLogs();
+                    renderLogWindow();
                 });
             }
+            updateVisibleLogs();
         });
 
+        // Live logs are pushed over Server-Sent Events; polling is only a fallback
+        function startLogStream() {
+            if (logStream || logPollInterval) return;
+            scheduleLogRender(); // The viewer had no size while the tab was hidden
+
+            logStream = new EventSource('/api/logs/stream?since=' + lastLogCount);
+            logStream.onmessage = (e) => {
+                const log = JSON.parse(e.data);
+                lastLogCount = log.s;
+                queueLog(log);
+            };
+            logStream.onerror = () => {
+                // EventSource reconnects on its own unless the stream was refused
+                if (logStream && logStream.readyState === EventSource.CLOSED) {
+                    logStream = null;
+                    startLogPolling();
+                }
+            };
+        }
+
+        function stopLogStream() {
+            if (logStream) {
+                logStream.close();
+                logStream = null;
+            }
+            stopLogPolling();
+        }
+
         function startLogPolling() {
             if (logPollInterval) return;
             fetchLogs(); // Fetch immediately
@@ -1397,9 +2062,12 @@ HTML_TEMPLATE = """
         }
 
         function clearLogs() {
-            // Note: This only clears the display, not the server buffer
-            document.getElementById('log-viewer').innerHTML = '';
-            lastLogCount = 0;
+            // Note: This only clears the display, not the server buffer.
+            // The cursor is kept, so only logs added after clearing are shown.
+            logEntries = [];
+            pendingLogs = [];
+            updateVisibleLogs();
+            renderLogWindow();
         }
 
         // Export/Import Functions
@@ -1705,9 +2373,16 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page has no template variables, so encode it once and serve it as-is
+HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+HTML_ETAG = hashlib.blake2b(HTML_BYTES, digest_size=8).hexdigest()
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    headers = {'ETag': f'"{HTML_ETAG}"', 'Cache-Control': 'public, max-age=60'}
+    if HTML_ETAG in request.if_none_match:
+        return Response(status=304, headers=headers)
+    return Response(HTML_BYTES, mimetype='text/html', headers=headers)
 
 @app.route('/api/config')
 def get_config():
@@ -1771,7 +2446,8 @@ def add_shortcut():
         if not address.startswith('/key/'):
             return jsonify({'success': False, 'message': 'Address must start with /key/'})
         
-        config['custom_shortcuts'][address] = data['shortcut']
+        # Swap in a new dict rather than mutating the one other threads may be reading
+        config['custom_shortcuts'] = {**config['custom_shortcuts'], address: data['shortcut']}
         save_config()
         
         return jsonify({'success': True})
@@ -1785,7 +2461,9 @@ def delete_shortcut():
         address = data['address']
 
         if address in config['custom_shortcuts']:
-            del config['custom_shortcuts'][address]
+            shortcuts = dict(config['custom_shortcuts'])
+            del shortcuts[address]
+            config['custom_shortcuts'] = shortcuts
             save_config()
             return jsonify({'success': True})
         else:
@@ -1883,16 +2561,80 @@ def import_apply():
 
 @app.route('/api/logs')
 def get_logs():
-    """Return all logs from the buffer"""
-    return jsonify({'logs': list(log_buffer)})
+    """
+    Return logs added since the `since` cursor, plus the cursor for the next call,
+    or an empty 204 if nothing was added. The OSC filter is applied by the browser.
+    """
+    since = request.args.get('since', 0, type=int)
+    entries, next_cursor = read_logs_since(since)
+    if next_cursor == since:
+        return Response(status=204)
+    # Buffer entries carry their JSON already, so the response is a plain join
+    body = b'{"logs":[%s],"next":%d}' % (b','.join(entry[3] for _, entry in entries), next_cursor)
+    return Response(body, mimetype='application/json')
+
+
+@app.route('/api/logs/stream')
+def stream_logs():
+    """
+    Stream log entries as Server-Sent Events, starting after the `since` cursor.
+    Answers 503 once MAX_LOG_STREAMS streams are open; the client then polls.
+    """
+    # EventSource sends Last-Event-ID when it reconnects; resume from there
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if last_event_id.isdigit():
+        since = int(last_event_id)
+    else:
+        since = request.args.get('since', 0, type=int)
+
+    subscriber = queue.Queue(maxsize=LOG_SUBSCRIBER_QUEUE_SIZE)
+    # Subscribe and read the backlog together so no entry is missed or sent twice
+    with buffer_handler.lock:
+        if len(log_subscribers) >= MAX_LOG_STREAMS:
+            return Response('Too many log streams', status=503, mimetype='text/plain')
+        entries, _ = read_logs_since(since)
+        log_subscribers.add(subscriber)
+
+    def unsubscribe():
+        with buffer_handler.lock:
+            log_subscribers.discard(subscriber)
+
+    def generate():
+        for seq, entry in entries:
+            yield format_log_event(seq, entry)
+        last_sent = time.monotonic()
+        while True:
+            try:
+                seq, entry = subscriber.get(timeout=LOG_DEDUP_WINDOW)
+            except queue.Empty:
+                # Store pending repeat counts, which arrive on the queue next
+                with buffer_handler.lock:
+                    buffer_handler.flush_repeats(time.time())
+                if time.monotonic() - last_sent >= LOG_KEEPALIVE_INTERVAL:
+                    yield b': keepalive\n\n'  # Lets us notice clients that went away
+                    last_sent = time.monotonic()
+                continue
+            yield format_log_event(seq, entry)
+            last_sent = time.monotonic()
+
+    response = Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+    # Runs when the server closes the response, even if streaming never started
+    response.call_on_close(unsubscribe)
+    return response
+
+
+def format_log_event(seq, entry):
+    """Format a buffer entry as a Server-Sent Event whose id is the log cursor"""
+    return b'id: %d\ndata: %s\n\n' % (seq, entry[3])
 
 
 @app.route('/favicon')
 def favicon():
     """Serve the favicon"""
-    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "OSCKeyIcon.png")
-    if os.path.exists(icon_path):
-        return send_file(icon_path, mimetype='image/png')
+    if ICON_EXISTS:
+        # Conditional GET: revalidations get a 304 instead of the PNG again
+        return send_from_directory(SCRIPT_DIR, "OSCKeyIcon.png", mimetype='image/png',
+                                   max_age=86400, conditional=True)
     return '', 404
 
 
@@ -1938,18 +2680,14 @@ class OSCKeyApp(rumps.App):
     """Menu bar application"""
 
     def __init__(self):
-        # Get the icon path
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "OSCKeyIcon.png")
-
         # Initialize rumps app with icon
         super(OSCKeyApp, self).__init__(
             "OSCKey",
-            icon=icon_path if os.path.exists(icon_path) else None,
+            icon=ICON_PATH if ICON_EXISTS else None,
             quit_button=None
         )
 
-        # Load configuration
-        load_config()
+        # Configuration is already loaded by main() before the servers start
 
         # Build menu
         self.menu = [
@@ -1972,6 +2710,15 @@ class OSCKeyApp(rumps.App):
         rumps.quit_application()
 
 
+def run_web_server(host):
+    """Serve the web UI, on waitress when it is installed"""
+    if WAITRESS_AVAILABLE:
+        # Open Logs tabs hold threads for their event streams, up to MAX_LOG_STREAMS
+        serve(app, host=host, port=5000, threads=WEB_SERVER_THREADS)
+    else:
+        app.run(host=host, port=5000, debug=False, use_reloader=False)
+
+
 def main():
     """Start the application"""
     global osc_thread
@@ -1986,6 +2733,12 @@ def main():
     # Check accessibility permissions
     check_accessibility_permissions()
 
+    # Keep one osascript process around for AppleScript key presses
+    start_applescript_helper()
+
+    # Start the keypress worker that presses queued OSC shortcuts
+    threading.Thread(target=keypress_worker, daemon=True).start()
+
     logger.info(f"Web UI: http://localhost:5000")
     logger.info(f"OSC Server: {config['osc_ip']}:{config['osc_port']}")
     logger.info(f"Custom Shortcuts Loaded: {len(config.get('custom_shortcuts', {}))}")
@@ -1997,10 +2750,7 @@ def main():
 
     # Start Flask in background thread
     flask_host = '0.0.0.0' if config.get('remote_access', False) else '127.0.0.1'
-    flask_thread = threading.Thread(
-        target=lambda: app.run(host=flask_host, port=5000, debug=False, use_reloader=False),
-        daemon=True
-    )
+    flask_thread = threading.Thread(target=run_web_server, args=(flask_host,), daemon=True)
     flask_thread.start()
 
     # Start menu bar app (if rumps available)